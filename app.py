@@ -1,33 +1,284 @@
 from __future__ import annotations
 
+import functools
+import io
 import os
+import queue
 import shutil
+import stat
 import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Optional
-from zipfile import ZipFile
+from typing import Iterable, Iterator, Optional, Tuple
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile, ZipInfo
 
-from flask import Flask, flash, redirect, render_template, request, send_file, after_this_request
+from flask import (
+    Flask,
+    Response,
+    after_this_request,
+    flash,
+    redirect,
+    render_template,
+    request,
+    send_file,
+)
 
 from wordtotex import ConversionResult, ConverterConfig, DocxToLatexConverter
 
 
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+ARCHIVE_BUFFER_SIZE = 1024 * 1024
+ARCHIVE_DEFLATE_LEVEL = 1
+
+WORK_ROOT = Path(tempfile.gettempdir()) / "wordtotex"
+WORK_DIR_SWEEP_INTERVAL = 60  # seconds
+# With X-Sendfile the front-end server reads the file after our response has closed.
+SENDFILE_RELEASE_DELAY = 60  # seconds
+
+
+def _max_upload_bytes() -> int:
+    try:
+        return int(os.getenv("WORDTOTEX_MAX_UPLOAD_MB", "50")) * 1024 * 1024
+    except ValueError:
+        return 50 * 1024 * 1024
+
+
+def _worker_count() -> int:
+    default = os.cpu_count() or 1
+    try:
+        return max(1, int(os.getenv("WORDTOTEX_WORKERS", str(default))))
+    except ValueError:
+        return default
+
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ProcessPoolExecutor:
+    """Return the process pool shared by all requests, creating it on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(max_workers=_worker_count())
+        return _executor
+
+
+def _discard_executor(broken: ProcessPoolExecutor) -> None:
+    """Drop a pool whose worker died so the next request starts a fresh one."""
+    global _executor
+    with _executor_lock:
+        if _executor is broken:
+            _executor = None
+    broken.shutdown(wait=False)
+
+
+def run_in_pool(fn, *args, **kwargs):
+    executor = get_executor()
+    try:
+        return executor.submit(fn, *args, **kwargs).result()
+    except BrokenProcessPool:
+        _discard_executor(executor)
+        raise
+
+
+def _empty_dir(path: Path) -> None:
+    for child in path.iterdir():
+        if child.is_dir() and not child.is_symlink():
+            shutil.rmtree(child, ignore_errors=True)
+        else:
+            try:
+                child.unlink()
+            except OSError:
+                pass
+
+
+def _ensure_private_dir(path: Path) -> None:
+    """Create ``path`` as a 0700 directory, or check that an existing one is ours alone.
+
+    The root sits in the shared temp directory under a predictable name, so another
+    local user could have created it first (or planted a symlink) to redirect
+    the deletes that emptying work directories performs.
+    """
+    try:
+        path.mkdir(mode=0o700)
+    except FileExistsError:
+        pass
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode):
+        raise RuntimeError(f"Refusing to use {path}: it is not a real directory")
+    if hasattr(os, "getuid"):
+        if info.st_uid != os.getuid():
+            raise RuntimeError(f"Refusing to use {path}: it is owned by another user")
+        if info.st_mode & 0o077:
+            os.chmod(path, 0o700)
+
+
+def _pid_alive(pid: int) -> bool:
+    if os.name == "nt":
+        import ctypes
+
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+        if not handle:
+            return False
+        exit_code = ctypes.c_ulong()
+        kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code))
+        kernel32.CloseHandle(handle)
+        return exit_code.value == 259  # STILL_ACTIVE
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class WorkDirPool:
+    """Working directories that are emptied and reused across requests.
+
+    Each process keeps its directories under ``<root>/<pid>`` so several server
+    processes can share the root without touching each other's files.
+    """
+
+    def __init__(self, root: Path, size: int) -> None:
+        self._shared_root = root
+        _ensure_private_dir(root)
+        self._root = root / str(os.getpid())
+        self._root.mkdir(mode=0o700, exist_ok=True)
+        self._idle: queue.Queue[Path] = queue.Queue()
+        self._owned: set[Path] = set()
+        for _ in range(size):
+            path = Path(tempfile.mkdtemp(prefix="w", dir=self._root))
+            self._owned.add(path)
+            self._idle.put(path)
+
+    def acquire(self) -> Path:
+        try:
+            path = self._idle.get_nowait()
+        except queue.Empty:
+            # Pool exhausted: hand out a one-off directory that release() deletes.
+            return Path(tempfile.mkdtemp(dir=self._root))
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def release(self, path: Path) -> None:
+        if path not in self._owned:
+            shutil.rmtree(path, ignore_errors=True)
+            return
+        if path.exists():
+            _empty_dir(path)
+        self._idle.put(path)
+
+    def sweep(self) -> None:
+        """Remove the per-process directories of server processes that have exited."""
+        own_pid = os.getpid()
+        for path in self._shared_root.iterdir():
+            if not path.name.isdigit() or int(path.name) == own_pid:
+                continue
+            if not _pid_alive(int(path.name)):
+                shutil.rmtree(path, ignore_errors=True)
+
+
+def _sweep_periodically(pool: WorkDirPool) -> None:
+    while True:
+        time.sleep(WORK_DIR_SWEEP_INTERVAL)
+        pool.sweep()
+
+
+_work_dirs: Optional[WorkDirPool] = None
+_work_dirs_lock = threading.Lock()
+
+
+def get_work_dirs() -> WorkDirPool:
+    """Return this process's working-directory pool, creating it on first use."""
+    global _work_dirs
+    with _work_dirs_lock:
+        if _work_dirs is None:
+            _work_dirs = WorkDirPool(WORK_ROOT, size=2 * _worker_count())
+            threading.Thread(
+                target=_sweep_periodically, args=(_work_dirs,), daemon=True
+            ).start()
+        return _work_dirs
+
+
 app = Flask(__name__)
 app.secret_key = "wordtotex-secret"  # for flash messages; replace in production
+app.config["MAX_CONTENT_LENGTH"] = _max_upload_bytes()
+# Only enable behind a server that honours X-Sendfile (Apache mod_xsendfile, lighttpd).
+# nginx ignores X-Sendfile; it needs X-Accel-Redirect, which is not supported here.
+app.config["USE_X_SENDFILE"] = os.getenv("WORDTOTEX_X_SENDFILE", "0") == "1"
+
+
+@functools.lru_cache(maxsize=4)
+def _get_converter(include_preamble: bool, table_border: bool) -> DocxToLatexConverter:
+    # Runs inside a process-pool worker; the pool already spreads work across cores.
+    config = ConverterConfig(
+        include_preamble=include_preamble, table_border=table_border, max_workers=1
+    )
+    return DocxToLatexConverter(config=config)
 
 
 def convert_upload(
     docx_path: Path, include_preamble: bool, table_border: bool, output_dir: Path
 ) -> tuple[Path, ConversionResult]:
-    config = ConverterConfig(include_preamble=include_preamble, table_border=table_border)
-    converter = DocxToLatexConverter(config=config)
+    converter = _get_converter(include_preamble, table_border)
     result = converter.convert(docx_path, output_dir=output_dir)
 
     output = output_dir / f"{docx_path.stem}.tex"
-    output.write_text(result.latex, encoding="utf-8")
+    result.write_tex(output)
     return output, result
 
 
+class _ZipSink(io.RawIOBase):
+    """Unseekable sink that collects ZipFile output until the response generator drains it."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def stream_zip(entries: Iterable[Tuple[Path, str, int]]) -> Iterator[bytes]:
+    """Yield a ZIP archive of ``(path, arcname, compress_type)`` entries as it is built."""
+    sink = _ZipSink()
+    with ZipFile(sink, "w", allowZip64=True) as archive:
+        for path, arcname, compress_type in entries:
+            info = ZipInfo.from_file(path, arcname)
+            info.compress_type = compress_type
+            if compress_type == ZIP_DEFLATED:
+                # ZipInfo.compress_level is public from Python 3.13; earlier versions
+                # only have the private slot that ZipFile.write(compresslevel=...) sets.
+                level_attr = (
+                    "compress_level" if hasattr(info, "compress_level") else "_compresslevel"
+                )
+                setattr(info, level_attr, ARCHIVE_DEFLATE_LEVEL)
+            with open(path, "rb") as src, archive.open(info, "w") as dst:
+                while True:
+                    block = src.read(ARCHIVE_BUFFER_SIZE)
+                    if not block:
+                        break
+                    dst.write(block)
+                    yield sink.drain()
+            yield sink.drain()
+    yield sink.drain()
+
+
 @app.route("/", methods=["GET", "POST"])
 def index():
     if request.method == "GET":
@@ -42,33 +293,45 @@ def index():
     table_border = request.form.get("table_border") == "on"
     output_stem = Path(file.filename).stem or "output"
 
-    temp_dir = Path(tempfile.mkdtemp())
+    work_dirs = get_work_dirs()
+    temp_dir = work_dirs.acquire()
 
     @after_this_request
     def _cleanup(response):
-        shutil.rmtree(temp_dir, ignore_errors=True)
+        if not response.direct_passthrough:
+            # Defer release until the streamed body has been fully sent.
+            response.call_on_close(lambda: work_dirs.release(temp_dir))
+        elif app.config["USE_X_SENDFILE"]:
+            # The front-end server reads the file only after this response is returned.
+            timer = threading.Timer(SENDFILE_RELEASE_DELAY, work_dirs.release, args=(temp_dir,))
+            timer.daemon = True
+            timer.start()
+        else:
+            # send_file has already opened the file, and Werkzeug hands passthrough
+            # bodies to the server as-is, so close hooks would never run.
+            work_dirs.release(temp_dir)
         return response
 
     upload_path = temp_dir / f"{output_stem}.docx"
-    file.save(upload_path)
+    with open(upload_path, "wb") as dst:
+        shutil.copyfileobj(file.stream, dst, length=UPLOAD_CHUNK_SIZE)
 
     try:
-        tex_path, result = convert_upload(
-            upload_path, include_preamble, table_border, output_dir=temp_dir
+        tex_path, result = run_in_pool(
+            convert_upload, upload_path, include_preamble, table_border, output_dir=temp_dir
         )
         if result.image_paths:
-            archive_path = temp_dir / f"{output_stem}_latex.zip"
-            with ZipFile(archive_path, "w") as archive:
-                archive.write(tex_path, arcname=tex_path.name)
-                for image_path in result.image_paths:
-                    archive.write(image_path, arcname=image_path.relative_to(temp_dir))
-
-            return send_file(
-                archive_path,
-                as_attachment=True,
-                download_name=archive_path.name,
-                mimetype="application/zip",
+            # Images are already compressed, so only the .tex is deflated.
+            entries = [(tex_path, tex_path.name, ZIP_DEFLATED)]
+            entries.extend(
+                (image_path, image_path.relative_to(temp_dir).as_posix(), ZIP_STORED)
+                for image_path in result.image_paths
             )
+            response = Response(stream_zip(entries), mimetype="application/zip")
+            response.headers.set(
+                "Content-Disposition", "attachment", filename=f"{output_stem}_latex.zip"
+            )
+            return response
 
         return send_file(
             tex_path,
@@ -81,6 +344,13 @@ def index():
         return redirect(request.url)
 
 
+@app.errorhandler(413)
+def upload_too_large(_exc):
+    limit_mb = app.config["MAX_CONTENT_LENGTH"] // (1024 * 1024)
+    flash(f"Upload is too large (limit is {limit_mb} MB).")
+    return redirect(request.url)
+
+
 def main() -> None:
     host = os.getenv("WORDTOTEX_HOST", "127.0.0.1")
     port_str = os.getenv("WORDTOTEX_PORT", "8000")
@@ -88,8 +358,14 @@ def main() -> None:
         port = int(port_str)
     except ValueError:
         port = 8000
-    app.run(debug=True, host=host, port=port)
+    debug = os.getenv("WORDTOTEX_DEBUG", "0") == "1"
+    app.run(host=host, port=port, threaded=True, debug=debug)
 
 
 if __name__ == "__main__":
+    print(
+        "Development server. For production use e.g.: "
+        "WORDTOTEX_WORKERS=2 gunicorn -w $(nproc) --worker-class gthread --threads 4 "
+        "-b 0.0.0.0:8000 app:app"
+    )
     main()
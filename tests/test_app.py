@@ -0,0 +1,136 @@
+import io
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from pathlib import Path
+
+from docx import Document
+
+import app as webapp
+
+
+def _docx_bytes() -> bytes:
+    document = Document()
+    document.add_paragraph("plain text")
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def _post_docx(client, data: bytes):
+    return client.post(
+        "/",
+        data={"docx_file": (io.BytesIO(data), "sample.docx")},
+        content_type="multipart/form-data",
+    )
+
+
+class WorkDirPoolTest(unittest.TestCase):
+    def test_tex_downloads_return_directories_to_pool_empty(self):
+        client = webapp.app.test_client()
+        pool = webapp.get_work_dirs()
+        pool_size = pool._idle.qsize()
+        data = _docx_bytes()
+
+        for _ in range(pool_size + 1):
+            response = _post_docx(client, data)
+            self.assertEqual(response.status_code, 200)
+            self.assertIn(b"plain text", response.get_data())
+            response.close()
+
+        self.assertEqual(pool._idle.qsize(), pool_size)
+        for path in pool._owned:
+            self.assertEqual(list(path.iterdir()), [])
+
+    def test_x_sendfile_releases_directory_after_delay(self):
+        client = webapp.app.test_client()
+        pool = webapp.get_work_dirs()
+        pool_size = pool._idle.qsize()
+
+        with mock.patch.dict(webapp.app.config, {"USE_X_SENDFILE": True}), mock.patch.object(
+            webapp, "SENDFILE_RELEASE_DELAY", 0.1
+        ):
+            response = _post_docx(client, _docx_bytes())
+            self.assertEqual(response.status_code, 200)
+            self.assertTrue(response.headers.get("X-Sendfile"))
+            response.close()
+
+        self.assertEqual(pool._idle.qsize(), pool_size - 1)
+        deadline = time.monotonic() + 5
+        while pool._idle.qsize() < pool_size and time.monotonic() < deadline:
+            time.sleep(0.05)
+        self.assertEqual(pool._idle.qsize(), pool_size)
+
+    def test_sweep_only_removes_directories_of_exited_processes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            pool_a = webapp.WorkDirPool(root, size=1)
+            in_use = pool_a.acquire()
+            (in_use / "upload.docx").write_bytes(b"data")
+
+            live_other = root / str(os.getppid())
+            live_other.mkdir()
+            exited = subprocess.Popen([sys.executable, "-c", "pass"])
+            exited.wait()
+            dead = root / str(exited.pid)
+            dead.mkdir()
+
+            pool_a.sweep()
+
+            self.assertTrue((in_use / "upload.docx").exists())
+            self.assertTrue(live_other.exists())
+            self.assertFalse(dead.exists())
+            pool_a.release(in_use)
+
+    def test_symlinked_root_is_refused(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            target = Path(tmp, "target")
+            target.mkdir()
+            root = Path(tmp, "root")
+            root.symlink_to(target)
+            with self.assertRaises(RuntimeError):
+                webapp.WorkDirPool(root, size=1)
+
+    def test_root_permissions_are_tightened(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp, "root")
+            root.mkdir(mode=0o777)
+            os.chmod(root, 0o777)
+            webapp.WorkDirPool(root, size=1)
+            if hasattr(os, "getuid"):
+                self.assertEqual(root.stat().st_mode & 0o777, 0o700)
+
+
+class ProcessPoolTest(unittest.TestCase):
+    @unittest.skipUnless(hasattr(signal, "SIGKILL"), "needs SIGKILL")
+    def test_pool_is_recreated_after_worker_dies(self):
+        client = webapp.app.test_client()
+        data = _docx_bytes()
+        response = _post_docx(client, data)
+        self.assertEqual(response.status_code, 200)
+        response.close()
+
+        broken = webapp.get_executor()
+        for process in list(broken._processes.values()):
+            os.kill(process.pid, signal.SIGKILL)
+            process.join()
+
+        response = _post_docx(client, data)
+        self.assertEqual(response.status_code, 302)
+        response.close()
+
+        response = _post_docx(client, data)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b"plain text", response.get_data())
+        response.close()
+        self.assertIsNot(webapp.get_executor(), broken)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,22 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from wordtotex.batch import batch_outputs
+
+
+class BatchOutputsTest(unittest.TestCase):
+    def test_same_stem_into_one_directory_is_rejected(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            out = Path(tmp) / "out"
+            with self.assertRaises(ValueError):
+                batch_outputs([Path(tmp, "a", "x.docx"), Path(tmp, "b", "x.docx")], out)
+            self.assertFalse(out.exists())
+
+    def test_same_stem_next_to_inputs_is_allowed(self):
+        inputs = [Path("a", "x.docx"), Path("b", "x.docx")]
+        self.assertEqual(batch_outputs(inputs), [Path("a", "x.tex"), Path("b", "x.tex")])
+
+
+if __name__ == "__main__":
+    unittest.main()
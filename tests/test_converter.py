@@ -0,0 +1,77 @@
+import io
+import struct
+import tempfile
+import unittest
+import zlib
+from pathlib import Path
+
+from docx import Document
+
+from wordtotex import ConverterConfig, DocxToLatexConverter
+
+
+def _png_bytes(rgb):
+    def chunk(kind, data):
+        body = kind + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+    header = struct.pack(">IIBBBBB", 1, 1, 8, 2, 0, 0, 0)
+    pixels = zlib.compress(b"\x00" + bytes(rgb))
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", pixels)
+        + chunk(b"IEND", b"")
+    )
+
+
+def _write_sample(path):
+    """A document long enough to be split into chunks, with lists spanning the cuts."""
+    document = Document()
+    document.add_heading("Sample", level=1)
+    for i in range(1, 390):
+        if i in (10, 220, 300):
+            document.add_picture(io.BytesIO(_png_bytes((i % 256, 0, 255 - i % 256))))
+        elif 55 <= i < 205:
+            document.add_paragraph(f"Bullet {i}", style="List Bullet")
+        elif 240 <= i < 280:
+            document.add_paragraph(f"Step {i}", style="List Number")
+        elif i % 50 == 0:
+            document.add_heading(f"Section {i}", level=2)
+        else:
+            document.add_paragraph(f"Paragraph {i}")
+    document.save(path)
+
+
+class ParallelConversionTest(unittest.TestCase):
+    def _convert(self, source, out_dir, max_workers):
+        converter = DocxToLatexConverter(ConverterConfig(max_workers=max_workers))
+        result = converter.convert(source, output_dir=out_dir)
+        images = [
+            (path.relative_to(out_dir), path.read_bytes()) for path in result.image_paths
+        ]
+        return converter, result.latex, images
+
+    def test_chunked_conversion_matches_sequential(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source = Path(tmp, "sample.docx")
+            _write_sample(source)
+            _, latex, images = self._convert(source, Path(tmp, "w1"), 1)
+            self.assertEqual(len(images), 3)
+            self.assertEqual(latex.count("\\begin{itemize}"), 1)
+            self.assertIn("\\begin{enumerate}", latex)
+
+            for workers in (2, 3, 6):
+                with self.subTest(max_workers=workers):
+                    converter, parallel_latex, parallel_images = self._convert(
+                        source, Path(tmp, f"w{workers}"), workers
+                    )
+                    blocks = list(converter._iter_block_items(Document(str(source))))
+                    self.assertGreater(len(blocks), 128)
+                    self.assertEqual(len(converter._split_blocks(blocks)), workers)
+                    self.assertEqual(parallel_latex, latex)
+                    self.assertEqual(parallel_images, images)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,13 +1,24 @@
 import argparse
+import dataclasses
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+from .batch import batch_outputs, convert_to_file
 from .converter import ConverterConfig, DocxToLatexConverter
 
 
 def parse_args() -> argparse.Namespace:
-    parser = argparse.ArgumentParser(description="Convert a Word .docx file to LaTeX .tex")
-    parser.add_argument("input", type=Path, help="Path to the .docx file to convert")
-    parser.add_argument("-o", "--output", type=Path, help="Where to write the .tex output")
+    parser = argparse.ArgumentParser(description="Convert Word .docx files to LaTeX .tex")
+    parser.add_argument(
+        "input", type=Path, nargs="+", help="Path(s) to the .docx file(s) to convert"
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        help="Where to write the .tex output (a directory when converting several files)",
+    )
     parser.add_argument(
         "--no-preamble",
         action="store_true",
@@ -18,26 +29,47 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Render tables without surrounding vertical borders",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for converting several files (default: CPU count)",
+    )
     return parser.parse_args()
 
 
 def main() -> None:
     args = parse_args()
-    if not args.input.exists():
-        raise FileNotFoundError(f"Input file not found: {args.input}")
+    for input_path in args.input:
+        if not input_path.exists():
+            raise FileNotFoundError(f"Input file not found: {input_path}")
 
-    output_dir = args.output.parent if args.output else args.input.parent
     config = ConverterConfig(
         include_preamble=not args.no_preamble,
         table_border=not args.no_table_border,
     )
-    converter = DocxToLatexConverter(config=config)
-    result = converter.convert(args.input, output_dir=output_dir)
 
-    if args.output:
-        args.output.write_text(result.latex, encoding="utf-8")
-    else:
-        print(result.latex)
+    if len(args.input) == 1:
+        input_path = args.input[0]
+        if args.output:
+            convert_to_file(input_path, args.output, config)
+        else:
+            converter = DocxToLatexConverter(config=config)
+            result = converter.convert(input_path, output_dir=input_path.parent)
+            print(result.latex)
+        return
+
+    outputs = batch_outputs(args.input, args.output)
+    workers = args.workers or os.cpu_count() or 1
+    # Each file already gets its own process, so converters stay single-threaded.
+    pool_config = dataclasses.replace(config, max_workers=1)
+    with ProcessPoolExecutor(max_workers=min(workers, len(args.input))) as executor:
+        futures = [
+            executor.submit(convert_to_file, input_path, output_path, pool_config)
+            for input_path, output_path in zip(args.input, outputs)
+        ]
+        for future in futures:
+            print(future.result())
 
 
 if __name__ == "__main__":
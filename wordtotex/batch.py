@@ -0,0 +1,44 @@
+"""Helpers for converting several files on a process pool.
+
+They live outside ``__main__`` because spawned worker processes (the default on
+Windows and macOS) cannot import functions defined in a package's ``__main__``.
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .converter import ConverterConfig, DocxToLatexConverter
+
+
+def convert_to_file(input_path: Path, output_path: Path, config: ConverterConfig) -> Path:
+    converter = DocxToLatexConverter(config=config)
+    result = converter.convert(input_path, output_dir=output_path.parent)
+    result.write_tex(output_path)
+    return output_path
+
+
+def batch_outputs(inputs: List[Path], output_dir: Optional[Path] = None) -> List[Path]:
+    """Return one .tex path per input, refusing inputs that would share an output.
+
+    Each .tex also gets a ``<stem>_images`` folder beside it, so two inputs mapping
+    to the same .tex would overwrite each other's text and images.
+    """
+    if output_dir is None:
+        outputs = [path.with_suffix(".tex") for path in inputs]
+    else:
+        outputs = [output_dir / f"{path.stem}.tex" for path in inputs]
+
+    seen: Dict[str, Path] = {}
+    for input_path, output_path in zip(inputs, outputs):
+        key = os.path.normcase(str(output_path.resolve()))
+        if key in seen:
+            raise ValueError(
+                f"{seen[key]} and {input_path} would both be written to {output_path}; "
+                "rename one of them or convert them separately"
+            )
+        seen[key] = input_path
+
+    if output_dir is not None:
+        output_dir.mkdir(parents=True, exist_ok=True)
+    return outputs
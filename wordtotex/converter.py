@@ -1,25 +1,112 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import functools
+import io
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, Iterator, List, Optional, Tuple, Union
-
-from docx import Document
-from docx.document import Document as DocumentType
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml.ns import qn
-from docx.table import _Cell, Table
-from docx.text.paragraph import Paragraph
-from docx.text.run import Run
-
-
-BLOCK = Union[Paragraph, Table]
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from docx.document import Document as DocumentType
+    from docx.opc.part import Part
+    from docx.table import _Cell, Table
+    from docx.text.paragraph import Paragraph
+    from docx.text.run import Run
+
+    BLOCK = Union[Paragraph, Table]
+    BLOCK_ITEM = Tuple[int, BLOCK]
+
+_ESCAPE_TABLE = str.maketrans(
+    {
+        "\\": r"\textbackslash{}",
+        "&": r"\&",
+        "%": r"\%",
+        "$": r"\$",
+        "#": r"\#",
+        "_": r"\_",
+        "{": r"\{",
+        "}": r"\}",
+        "~": r"\textasciitilde{}",
+        "^": r"\textasciicircum{}",
+    }
+)
+
+_PIC_NS = {
+    "pic": "http://schemas.openxmlformats.org/drawingml/2006/picture",
+    "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+    "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+}
+_R_EMBED = "{%s}embed" % _PIC_NS["r"]
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_RPR = _W + "rPr"
+_W_COLOR = _W + "color"
+_W_UNDERLINE = _W + "u"
+_W_ITALIC = _W + "i"
+_W_BOLD = _W + "b"
+_W_FONTS = _W + "rFonts"
+_W_SIZE = _W + "sz"
+
+# python-docx and lxml take most of the import time, so they are bound by _load_docx()
+# on the first conversion rather than when the package is imported.
+_docx_loaded = False
+_Document: Any = None
+_DocumentType: Any = None
+_Paragraph: Any = None
+_Table: Any = None
+_ALIGN_CENTER: Any = None
+_ALIGN_RIGHT: Any = None
+_PIC_XPATH: Any = None
+_BLIP_XPATH: Any = None
+
+# Heading level digit (the character after "heading ") to sectioning command.
+_HEADING_COMMANDS = {
+    "1": "\\section",
+    "2": "\\subsection",
+    "3": "\\subsubsection",
+    "4": "\\paragraph",
+    "5": "\\subparagraph",
+}
+
+# Block kinds yielded by _iter_block_items alongside each block.
+_PARAGRAPH = 0
+_TABLE = 1
+
+# Smallest number of body blocks worth handing to a separate worker thread.
+_MIN_BLOCKS_PER_CHUNK = 64
+
+# Placeholder for an image path inside chunk output; XML text cannot contain NUL.
+_IMAGE_TOKEN_RE = re.compile("\x00\\d+:\\d+\x00")
+
+
+def _load_docx() -> None:
+    global _docx_loaded, _Document, _DocumentType, _Paragraph, _Table
+    global _ALIGN_CENTER, _ALIGN_RIGHT, _PIC_XPATH, _BLIP_XPATH
+    if _docx_loaded:
+        return
+
+    from docx import Document
+    from docx.document import Document as DocumentType
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from docx.table import Table
+    from docx.text.paragraph import Paragraph
+    from lxml import etree
+
+    _Document, _DocumentType, _Paragraph, _Table = Document, DocumentType, Paragraph, Table
+    _ALIGN_CENTER, _ALIGN_RIGHT = WD_ALIGN_PARAGRAPH.CENTER, WD_ALIGN_PARAGRAPH.RIGHT
+    _PIC_XPATH = etree.XPath(".//pic:pic", namespaces=_PIC_NS)
+    _BLIP_XPATH = etree.XPath(".//a:blip", namespaces=_PIC_NS)
+    _docx_loaded = True
 
 
 @dataclass
 class ConverterConfig:
     include_preamble: bool = True
     table_border: bool = True
+    max_workers: Optional[int] = None
 
 
 @dataclass
@@ -27,92 +114,204 @@ class ConversionResult:
     latex: str
     image_paths: List[Path]
 
+    def write_tex(self, path: Path) -> None:
+        """Write the LaTeX source as UTF-8 in one encode pass, without newline translation."""
+        path.write_bytes(self.latex.encode("utf-8"))
+
+
+@dataclass
+class _Chunk:
+    """Output of converting one contiguous slice of body blocks."""
+
+    index: int
+    out: io.StringIO = field(default_factory=io.StringIO)
+    images: List[Part] = field(default_factory=list)
+    head_list: Optional[str] = None
+    tail_list: Optional[str] = None
+
 
 class DocxToLatexConverter:
+    _PREAMBLE = (
+        "\\documentclass{article}\n"
+        "\\usepackage[utf8]{inputenc}\n"
+        "\\usepackage{array}\n"
+        "\\usepackage{xcolor}\n"
+        "\\usepackage{hyperref}\n"
+        "\\usepackage{graphicx}\n"
+        "\\begin{document}\n"
+        "\n"
+    )
+    _POSTAMBLE = "\n\\end{document}\n"
+
     def __init__(self, config: Optional[ConverterConfig] = None) -> None:
         self.config = config or ConverterConfig()
-        self._image_dir: Optional[Path] = None
-        self._saved_images: List[Path] = []
-        self._tex_output_dir: Optional[Path] = None
-        self._image_counter: int = 1
 
     def convert(
         self, docx_path: Union[str, Path], output_dir: Optional[Path] = None
     ) -> ConversionResult:
         docx_path = Path(docx_path)
-        document = Document(docx_path)
-        self._tex_output_dir = Path(output_dir) if output_dir else docx_path.parent
-        self._image_dir = self._tex_output_dir / f"{docx_path.stem}_images"
-        self._saved_images = []
-        self._image_counter = 1
-
-        lines: List[str] = []
+        _load_docx()
+        document = _Document(docx_path)
+        tex_output_dir = Path(output_dir) if output_dir else docx_path.parent
+        image_rel_prefix = f"{docx_path.stem}_images"
+        image_dir = tex_output_dir / image_rel_prefix
+
+        blocks = list(self._iter_block_items(document))
+        groups = self._split_blocks(blocks)
+        if len(groups) > 1:
+            # Resolve the styles part up front so worker threads only read the package.
+            _ = document.styles
+            with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+                chunks = list(executor.map(self._convert_chunk, range(len(groups)), groups))
+        else:
+            chunks = [self._convert_chunk(0, blocks)]
+
+        body, image_paths = self._save_images(
+            chunks, self._merge_chunks(chunks), image_dir, image_rel_prefix
+        )
+        body = body.strip() + "\n"
+        latex = self._wrap_document(body) if self.config.include_preamble else body
+        return ConversionResult(latex=latex, image_paths=image_paths)
+
+    def _split_blocks(self, blocks: List[BLOCK_ITEM]) -> List[List[BLOCK_ITEM]]:
+        workers = self.config.max_workers or os.cpu_count() or 1
+        count = min(workers, len(blocks) // _MIN_BLOCKS_PER_CHUNK)
+        if count <= 1:
+            return [blocks]
+        size = -(-len(blocks) // count)
+        return [blocks[start : start + size] for start in range(0, len(blocks), size)]
+
+    def _convert_chunk(self, index: int, blocks: List[BLOCK_ITEM]) -> _Chunk:
+        chunk = _Chunk(index)
+        out = chunk.out
         current_list: Optional[str] = None
 
-        for block in self._iter_block_items(document):
-            list_type = self._get_list_type(block) if isinstance(block, Paragraph) else None
-            if current_list and list_type != current_list:
-                lines.append(f"\\end{{{current_list}}}")
-                current_list = None
-
-            if isinstance(block, Paragraph):
-                paragraph_tex, opened_list = self._convert_paragraph(block, list_type)
-                if opened_list and not current_list:
-                    lines.append(f"\\begin{{{opened_list}}}")
-                    current_list = opened_list
-                if paragraph_tex:
-                    lines.append(paragraph_tex)
-            elif isinstance(block, Table):
-                if current_list:
-                    lines.append(f"\\end{{{current_list}}}")
-                    current_list = None
-                lines.extend(self._convert_table(block))
+        for position, (kind, block) in enumerate(blocks):
+            style_name = ""
+            list_type = None
+            if kind == _PARAGRAPH:
+                style = block.style
+                style_name = style.name if style is not None else ""
+                list_type = self._get_list_type(style_name)
+            if not position:
+                chunk.head_list = list_type
+            current_list = self._switch_list(out, current_list, list_type)
+
+            if kind == _PARAGRAPH:
+                self._convert_paragraph(chunk, block, style_name, list_type)
+            else:
+                self._convert_table(chunk, block)
+
+        chunk.tail_list = current_list
+        return chunk
+
+    @staticmethod
+    def _switch_list(
+        out: io.StringIO, current: Optional[str], wanted: Optional[str]
+    ) -> Optional[str]:
+        """Close/open list environments so ``wanted`` is the open list; return it."""
+        if current and wanted != current:
+            out.write(f"\\end{{{current}}}\n")
+            current = None
+        if wanted and not current:
+            out.write(f"\\begin{{{wanted}}}\n")
+            current = wanted
+        return current
+
+    def _merge_chunks(self, chunks: List[_Chunk]) -> str:
+        """Join chunk output in order, stitching list environments across boundaries."""
+        out = io.StringIO()
+        current_list: Optional[str] = None
+        for chunk in chunks:
+            text = chunk.out.getvalue()
+            if current_list and current_list == chunk.head_list:
+                text = text[len(f"\\begin{{{current_list}}}\n") :]
+            elif current_list:
+                out.write(f"\\end{{{current_list}}}\n")
+            out.write(text)
+            current_list = chunk.tail_list
 
         if current_list:
-            lines.append(f"\\end{{{current_list}}}")
-
-        body = "\n".join(lines).strip() + "\n"
-        latex = self._wrap_document(body) if self.config.include_preamble else body
-        return ConversionResult(latex=latex, image_paths=self._saved_images.copy())
+            out.write(f"\\end{{{current_list}}}\n")
+        return out.getvalue()
+
+    def _save_images(
+        self, chunks: List[_Chunk], body: str, image_dir: Path, image_rel_prefix: str
+    ) -> Tuple[str, List[Path]]:
+        """Write collected images in document order and fill in their paths."""
+        saved_images: List[Path] = []
+        rel_paths: Dict[str, str] = {}
+        for chunk in chunks:
+            for local_idx, image_part in enumerate(chunk.images):
+                if not saved_images:
+                    image_dir.mkdir(parents=True, exist_ok=True)
+                ext = Path(str(image_part.partname)).suffix or ".png"
+                image_name = f"image_{len(saved_images) + 1}{ext}"
+                image_path = image_dir / image_name
+                # python-docx reads every part into memory when the package is opened and
+                # closes the zip, so the blob is written as-is rather than re-streamed.
+                image_path.write_bytes(image_part.blob)
+                saved_images.append(image_path)
+                token = self._image_token(chunk.index, local_idx)
+                rel_paths[token] = f"{image_rel_prefix}/{image_name}"
+
+        if not rel_paths:
+            return body, saved_images
+        return _IMAGE_TOKEN_RE.sub(lambda match: rel_paths[match.group(0)], body), saved_images
+
+    @staticmethod
+    def _image_token(chunk_index: int, image_index: int) -> str:
+        return f"\x00{chunk_index}:{image_index}\x00"
 
     def _convert_paragraph(
-        self, paragraph: Paragraph, list_type: Optional[str]
-    ) -> Tuple[str, Optional[str]]:
-        text = self._build_runs(paragraph)
+        self, chunk: _Chunk, paragraph: Paragraph, style_name: str, list_type: Optional[str]
+    ) -> None:
+        out = chunk.out
+        text = self._build_runs(chunk, paragraph)
         if not text:
-            return "", list_type
+            return
 
-        style = paragraph.style.name if paragraph.style is not None else ""
-        heading = self._heading_command(style)
+        heading = self._heading_command(style_name)
         if heading:
-            return f"{heading}{{{text}}}\n", None
+            out.write(heading)
+            out.write("{")
+            out.write(text)
+            out.write("}\n\n")
+            return
 
         if list_type:
-            return f"\\item {text}", list_type
-
-        aligned = self._apply_alignment(text, paragraph.alignment)
-        return f"{aligned}\n", None
-
-    def _convert_table(self, table: Table) -> List[str]:
-        rows_tex: List[str] = []
-        num_cols = max(len(row.cells) for row in table.rows)
-        alignment = "|".join(self._column_alignment(table, idx) for idx in range(num_cols))
+            out.write("\\item ")
+            out.write(text)
+            out.write("\n")
+            return
+
+        out.write(self._apply_alignment(text, paragraph.alignment))
+        out.write("\n\n")
+
+    def _convert_table(self, chunk: _Chunk, table: Table) -> None:
+        out = chunk.out
+        rows_cells = [list(row.cells) for row in table.rows]
+        num_cols = max(map(len, rows_cells))
+        cell_aligns = [[self._cell_alignment(cell) for cell in cells] for cells in rows_cells]
+        alignment = "|".join(self._column_alignment(cell_aligns, idx) for idx in range(num_cols))
         border = "|" if self.config.table_border else ""
-        rows_tex.append(f"\\begin{{tabular}}{{{border}{alignment}{border}}}")
-        rows_tex.append("\\hline")
+        out.write(f"\\begin{{tabular}}{{{border}{alignment}{border}}}\n")
+        out.write("\\hline\n")
 
-        for row in table.rows:
-            cells = [self._convert_cell(cell) for cell in row.cells]
-            rows_tex.append(" & ".join(cells) + " \\\\")
-            rows_tex.append("\\hline")
+        for cells in rows_cells:
+            for idx, cell in enumerate(cells):
+                if idx:
+                    out.write(" & ")
+                self._convert_cell(chunk, cell)
+            out.write(" \\\\\n")
+            out.write("\\hline\n")
 
-        rows_tex.append("\\end{tabular}\n")
-        return rows_tex
+        out.write("\\end{tabular}\n\n")
 
-    def _build_runs(self, paragraph: Paragraph) -> str:
+    def _build_runs(self, chunk: _Chunk, paragraph: Paragraph) -> str:
         parts: List[str] = []
         for run in paragraph.runs:
-            image_snippets = self._extract_images(run)
+            image_snippets = self._extract_images(chunk, run)
             parts.extend(image_snippets)
             content = self._escape_tex(run.text)
             if not content:
@@ -125,133 +324,127 @@ class DocxToLatexConverter:
         if not text:
             return ""
 
-        replacements = {
-            "\\": r"\textbackslash{}",
-            "&": r"\&",
-            "%": r"\%",
-            "$": r"\$",
-            "#": r"\#",
-            "_": r"\_",
-            "{": r"\{",
-            "}": r"\}",
-            "~": r"\textasciitilde{}",
-            "^": r"\textasciicircum{}",
-        }
-        escaped = []
-        for char in text.replace("\n", r"\\ "):
-            escaped.append(replacements.get(char, char))
-        return "".join(escaped)
-
-    def _heading_command(self, style_name: str) -> Optional[str]:
+        return text.replace("\n", r"\\ ").translate(_ESCAPE_TABLE)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _heading_command(style_name: str) -> Optional[str]:
         normalized = style_name.lower()
-        if normalized.startswith("heading 1"):
-            return "\\section"
-        if normalized.startswith("heading 2"):
-            return "\\subsection"
-        if normalized.startswith("heading 3"):
-            return "\\subsubsection"
-        if normalized.startswith("heading 4"):
-            return "\\paragraph"
-        if normalized.startswith("heading 5"):
-            return "\\subparagraph"
+        if normalized.startswith("heading ") and len(normalized) > 8:
+            return _HEADING_COMMANDS.get(normalized[8])
         return None
 
-    def _get_list_type(self, paragraph: Paragraph) -> Optional[str]:
-        style_name = paragraph.style.name.lower() if paragraph.style is not None else ""
-        if style_name.startswith("list bullet") or style_name.startswith("blockquote"):
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _get_list_type(style_name: str) -> Optional[str]:
+        normalized = style_name.lower()
+        if normalized.startswith("list bullet") or normalized.startswith("blockquote"):
             return "itemize"
-        if style_name.startswith("list number"):
+        if normalized.startswith("list number"):
             return "enumerate"
         return None
 
     def _apply_alignment(self, text: str, alignment: Optional[int]) -> str:
-        if alignment == WD_ALIGN_PARAGRAPH.CENTER:
+        if alignment == _ALIGN_CENTER:
             return f"\\begin{{center}}{text}\\end{{center}}"
-        if alignment == WD_ALIGN_PARAGRAPH.RIGHT:
+        if alignment == _ALIGN_RIGHT:
             return f"\\begin{{flushright}}{text}\\end{{flushright}}"
         return text
 
     def _apply_run_formatting(self, content: str, run: Run) -> str:
-        formatted = content
+        # Runs without direct formatting are the common case; skip the font lookups.
+        rpr = run.element.find(_RPR)
+        if rpr is None:
+            return content
 
+        formatted = content
         font = run.font
         hex_color = None
-        if font and font.color and font.color.rgb:
-            rgb = font.color.rgb
+        rgb = font.color.rgb if rpr.find(_W_COLOR) is not None else None
+        if rgb:
             hex_color = getattr(rgb, "hex", None) or str(rgb).replace("0x", "").replace("#", "")
             if len(hex_color) == 8:  # strip alpha if present
                 hex_color = hex_color[2:]
         if hex_color:
             formatted = f"\\textcolor[HTML]{{{hex_color}}}{{{formatted}}}"
 
-        if run.underline:
+        if rpr.find(_W_UNDERLINE) is not None and font.underline:
             formatted = f"\\underline{{{formatted}}}"
-        if run.italic:
+        if rpr.find(_W_ITALIC) is not None and font.italic:
             formatted = f"\\textit{{{formatted}}}"
-        if run.bold:
+        if rpr.find(_W_BOLD) is not None and font.bold:
             formatted = f"\\textbf{{{formatted}}}"
 
-        if font and font.name and self._is_monospace(font.name):
+        font_name = font.name if rpr.find(_W_FONTS) is not None else None
+        if font_name and self._is_monospace(font_name):
             formatted = f"\\texttt{{{formatted}}}"
 
-        size_cmd = self._size_command(font.size.pt if font and font.size else None)
+        size = font.size if rpr.find(_W_SIZE) is not None else None
+        size_cmd = self._size_command(size.pt if size else None)
         if size_cmd:
             formatted = f"{{{size_cmd} {formatted}}}"
         return formatted
 
-    def _column_alignment(self, table: Table, col_idx: int) -> str:
-        alignments: List[str] = []
-        for row in table.rows:
-            if col_idx >= len(row.cells):
-                continue
-            cell = row.cells[col_idx]
-            alignment = None
-            if cell.paragraphs:
-                alignment = cell.paragraphs[0].alignment
-            alignments.append(self._map_alignment(alignment))
+    def _cell_alignment(self, cell: _Cell) -> str:
+        paragraphs = cell.paragraphs
+        return self._map_alignment(paragraphs[0].alignment if paragraphs else None)
 
+    def _column_alignment(self, cell_aligns: List[List[str]], col_idx: int) -> str:
         # pick the most common alignment in this column, fallback to left
-        left = "l"
-        if not alignments:
-            return left
-        counts = {"l": 0, "c": 0, "r": 0}
-        for align in alignments:
-            counts[align] = counts.get(align, 0) + 1
-        return max(counts.items(), key=lambda item: item[1])[0]
-
-    def _convert_cell(self, cell: _Cell) -> str:
-        if not cell.paragraphs:
-            return ""
-        parts: List[str] = []
+        l_ct = c_ct = r_ct = 0
+        for row_aligns in cell_aligns:
+            if col_idx >= len(row_aligns):
+                continue
+            align = row_aligns[col_idx]
+            if align == "c":
+                c_ct += 1
+            elif align == "r":
+                r_ct += 1
+            else:
+                l_ct += 1
+        if l_ct >= c_ct and l_ct >= r_ct:
+            return "l"
+        return "c" if c_ct >= r_ct else "r"
+
+    def _convert_cell(self, chunk: _Chunk, cell: _Cell) -> None:
+        out = chunk.out
+        first = True
         for paragraph in cell.paragraphs:
-            text = self._build_runs(paragraph)
+            text = self._build_runs(chunk, paragraph)
             if not text:
                 continue
+            if not first:
+                out.write(r" \\ ")
+            first = False
             align_prefix = self._cell_alignment_prefix(paragraph.alignment)
             if align_prefix:
-                text = f"{{{align_prefix} {text}}}"
-            parts.append(text)
-        return r" \\ ".join(parts) if parts else ""
+                out.write(f"{{{align_prefix} {text}}}")
+            else:
+                out.write(text)
 
     def _map_alignment(self, alignment: Optional[int]) -> str:
-        if alignment == WD_ALIGN_PARAGRAPH.CENTER:
+        if alignment == _ALIGN_CENTER:
             return "c"
-        if alignment == WD_ALIGN_PARAGRAPH.RIGHT:
+        if alignment == _ALIGN_RIGHT:
             return "r"
         return "l"
 
     def _cell_alignment_prefix(self, alignment: Optional[int]) -> str:
-        if alignment == WD_ALIGN_PARAGRAPH.CENTER:
+        if alignment == _ALIGN_CENTER:
             return "\\centering"
-        if alignment == WD_ALIGN_PARAGRAPH.RIGHT:
+        if alignment == _ALIGN_RIGHT:
             return "\\raggedleft"
         return ""
 
-    def _is_monospace(self, font_name: str) -> bool:
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _is_monospace(font_name: str) -> bool:
         lowered = font_name.lower()
         return any(keyword in lowered for keyword in ("mono", "consolas", "courier", "code"))
 
-    def _size_command(self, size_pt: Optional[float]) -> Optional[str]:
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _size_command(size_pt: Optional[float]) -> Optional[str]:
         if size_pt is None:
             return None
         if size_pt >= 18:
@@ -265,37 +458,28 @@ class DocxToLatexConverter:
         return None
 
     def _wrap_document(self, body: str) -> str:
-        preamble = [
-            r"\documentclass{article}",
-            r"\usepackage[utf8]{inputenc}",
-            r"\usepackage{array}",
-            r"\usepackage{xcolor}",
-            r"\usepackage{hyperref}",
-            r"\usepackage{graphicx}",
-            r"\begin{document}",
-        ]
-        return "\n".join(preamble) + "\n\n" + body + "\n\\end{document}\n"
-
-    def _iter_block_items(self, parent: Union[DocumentType, _Cell]) -> Iterator[BLOCK]:
-        parent_elm = parent.element.body if isinstance(parent, DocumentType) else parent._tc
+        return self._PREAMBLE + body + self._POSTAMBLE
+
+    def _iter_block_items(self, parent: Union[DocumentType, _Cell]) -> Iterator[BLOCK_ITEM]:
+        parent_elm = parent.element.body if isinstance(parent, _DocumentType) else parent._tc
         for child in parent_elm.iterchildren():
             if child.tag.endswith("}p"):
-                yield Paragraph(child, parent)
+                yield _PARAGRAPH, _Paragraph(child, parent)
             elif child.tag.endswith("}tbl"):
-                yield Table(child, parent)
+                yield _TABLE, _Table(child, parent)
 
-    def _extract_images(self, run: Run) -> List[str]:
-        """Save images embedded in a run and return LaTeX includegraphics commands."""
-        if self._tex_output_dir is None:
-            return []
+    def _extract_images(self, chunk: _Chunk, run: Run) -> List[str]:
+        """Collect images embedded in a run and return LaTeX includegraphics commands.
 
+        The image files are written by ``_save_images`` once every chunk is done, so
+        numbering follows document order; until then each path is a placeholder token.
+        """
         snippets: List[str] = []
-        pictures = run.element.xpath(".//pic:pic")
-        for pic in pictures:
-            blips = pic.xpath(".//a:blip")
+        for pic in _PIC_XPATH(run.element):
+            blips = _BLIP_XPATH(pic)
             if not blips:
                 continue
-            embed = blips[0].get(qn("r:embed"))
+            embed = blips[0].get(_R_EMBED)
             if not embed:
                 continue
 
@@ -303,29 +487,8 @@ class DocxToLatexConverter:
             if not image_part:
                 continue
 
-            ext = Path(str(image_part.partname)).suffix or ".png"
-            image_name = f"image_{self._image_counter}{ext}"
-            self._image_counter += 1
-            image_dir = self._ensure_image_dir()
-            image_path = image_dir / image_name
-            image_path.write_bytes(image_part.blob)
-            self._saved_images.append(image_path)
-
-            rel_path = self._relative_image_path(image_path)
-            snippets.append(f"\n\\includegraphics[width=\\linewidth]{{{rel_path}}}\n")
+            token = self._image_token(chunk.index, len(chunk.images))
+            chunk.images.append(image_part)
+            snippets.append(f"\n\\includegraphics[width=\\linewidth]{{{token}}}\n")
 
         return snippets
-
-    def _ensure_image_dir(self) -> Path:
-        if self._image_dir is None:
-            raise ValueError("Image directory is not configured")
-        self._image_dir.mkdir(parents=True, exist_ok=True)
-        return self._image_dir
-
-    def _relative_image_path(self, image_path: Path) -> str:
-        base_dir = self._tex_output_dir or image_path.parent
-        try:
-            rel_path = image_path.relative_to(base_dir)
-        except ValueError:
-            rel_path = image_path
-        return rel_path.as_posix()